@@ -1,19 +1,75 @@
-from collections import defaultdict, namedtuple
+import re
+from collections import namedtuple
+
+CARD_SEP = re.compile(r'[,\s]+')
 
 SUIT_NAMES = ['Spade', 'Coppe', 'Denari', 'Bastoni']
 SUIT_SHORTNAMES = [suit_name[0] for suit_name in SUIT_NAMES]
-PRIMIERA_POINTS = defaultdict(int, {1: 16, 2: 12, 3: 13, 4: 14, 5: 15, 6: 18, 7: 21, 8: 10, 9: 10, 10: 10})
+SUIT_INDEX = {shortname: suit for suit, shortname in enumerate(SUIT_SHORTNAMES)}
+# indexed by card value; entry 0 is unused
+PRIMIERA_POINTS = (0, 16, 12, 13, 14, 15, 18, 21, 10, 10, 10)
+VALUE_MASKS = tuple(0xF << ((value - 1) * 4) for value in range(1, 11))
+CARD_VALUES = tuple((card >> 2) + 1 for card in range(40))
+CARD_SUITS = tuple(card & 3 for card in range(40))
+CARD_STRS = tuple(f"{(card >> 2) + 1}{SUIT_SHORTNAMES[card & 3]}" for card in range(40))
 SETTEBELLO_SUIT = 2
 SETTEBELLO_VALUE = 7
+SETTEBELLO_ID = (SETTEBELLO_VALUE - 1) * 4 + SETTEBELLO_SUIT
+DENARI_MASK = sum(1 << ((value - 1) * 4 + SETTEBELLO_SUIT) for value in range(1, 11))
+# per suit, the card ids sorted by decreasing primiera points
+PRIMIERA_ORDER = tuple(tuple(sorted(((value - 1) * 4 + suit for value in range(1, 11)),
+                                    key=lambda card: -PRIMIERA_POINTS[CARD_VALUES[card]]))
+                       for suit in range(4))
+
+def card_value(card):
+    r"""
+    Return the value (1 through 10) of the card with id ``card``.
+    """
+    return (card >> 2) + 1
+
+def card_suit(card):
+    r"""
+    Return the suit (0 through 3) of the card with id ``card``.
+    """
+    return card & 3
+
+class Trick:
+    r"""
+    One trick: the card played, the cards picked up (an empty tuple for
+    a placement) and whether it scored a scopa point.
+    """
+    __slots__ = ('card_played', 'cards_picked_up', 'scopa')
+
+    def __init__(self, card_played, cards_picked_up, scopa):
+        self.card_played = card_played
+        self.cards_picked_up = cards_picked_up
+        self.scopa = scopa
+
+    def __repr__(self):
+        return (f"Trick(card_played={self.card_played},"
+                f" cards_picked_up={self.cards_picked_up},"
+                f" scopa={self.scopa})")
 
-Trick = namedtuple('Trick', ['card_played', 'cards_picked_up', 'scopa'])
+    def __eq__(self, other):
+        return (isinstance(other, Trick)
+                and self.card_played == other.card_played
+                and self.cards_picked_up == other.cards_picked_up
+                and self.scopa == other.scopa)
 
 class Player(namedtuple('Player', 'number')):
+    __slots__ = ()
+
     def __repr__(self):
         return f"Player{self.number}"
 
-class Card(namedtuple('Card', ['value', 'suit'])):
+    @property
+    def index(self):
+        return self.number - 1
+
+class Card(int):
     r"""
+    A card, encoded as the single integer ``(value - 1) * 4 + suit``
+    in the range `[0, 40)`.
 
     EXAMPLES::
 
@@ -32,58 +88,115 @@ class Card(namedtuple('Card', ['value', 'suit'])):
         sage: Card(Card('10D'))
         10D
 
+    A card *is* its integer id, so equality, hashing and bit
+    arithmetic are plain ``int`` operations::
+
+        sage: int(Card('8S'))
+        28
+        sage: Card('8S') == 28
+        True
+
+    The 40 cards are interned, so every spelling returns the same
+    object::
+
+        sage: Card('8S') is Card(8, 0)
+        True
+
     """
+    __slots__ = ()
+
     def __new__(cls, *data):
         if len(data) == 1:
             if isinstance(data[0], Card):
                 return data[0]
             if isinstance(data[0], str):
-                value = int(data[0][:-1])
-                suit  = SUIT_SHORTNAMES.index(data[0][-1])
-        else:
-            (value, suit) = data
-        return super().__new__(cls, value, suit)
+                return CARD_BY_STR[data[0]]
+        (value, suit) = data
+        return CARDS[(value - 1) * 4 + suit]
+
+    @property
+    def value(self):
+        return (self >> 2) + 1
+
+    @property
+    def suit(self):
+        return self & 3
 
     def __repr__(self):
-        return f"{self.value}{SUIT_SHORTNAMES[self.suit]}"
+        return CARD_STRS[self]
+
+# the canonical pool of the 40 interned Card instances, in id order;
+# int.__new__ sidesteps the interning lookup in Card.__new__
+CARDS = tuple(int.__new__(Card, card) for card in range(40))
+CARD_BY_STR = {CARD_STRS[card]: CARDS[card] for card in range(40)}
+BASE_DECK = tuple(Card(value, suit) for suit in range(4) for value in range(1, 11))
+
+def cards_from_mask(mask):
+    r"""
+    Return the cards whose bits are set in ``mask``, in id order.
+
+    EXAMPLES::
+
+        sage: cards_from_mask(0)
+        ()
+        sage: cards_from_mask((1 << Card('8B')) | (1 << Card('1C')))
+        (1C, 8B)
+
+    """
+    cards = []
+    while mask:
+        cards.append(CARDS[(mask & -mask).bit_length() - 1])
+        mask &= mask - 1
+    return tuple(cards)
 
 class Deck:
     def __init__(self):
-        # Create the deck: each card is represented as (suit, value)
         from random import shuffle
-        self._cards = [Card(value, suit) for suit in range(4) for value in range(1, 11)]
+        self._cards = list(BASE_DECK)
         shuffle(self._cards)
+        self._num_remaining = len(self._cards)
 
     def __iter__(self):
-        return iter(self._cards)
+        return iter(self._cards[:self._num_remaining])
 
     def __len__(self):
-        return len(self._cards)
+        return self._num_remaining
 
     def card_from_str(self, data):
         value = int(data[:-1])
-        suit = SUIT_SHORTNAMES.index(data[-1])
-        return (value, suit)
+        suit = SUIT_INDEX[data[-1]]
+        return Card(value, suit)
 
-    def card_to_str(self, data):
-        return f"{data[0]}{SUIT_SHORTNAMES[data[1]]}"
+    def card_to_str(self, card):
+        return CARD_STRS[card]
 
     def cards_to_str(self, cards):
-        return [card.to_str() for card in cards]
+        return [CARD_STRS[card] for card in cards]
 
     def display_state(self):
-        print(' '.join(self.card_to_str(card) for card in self._cards))
+        print(' '.join(CARD_STRS[card] for card in self._cards[:self._num_remaining]))
 
     def deal_cards(self, num_cards):
-        return [self._cards.pop() for _ in range(num_cards)]
+        # the deck stays intact; a cursor marks the undealt prefix, so
+        # dealing is a slice instead of resizing the list.  Cards come
+        # off the top of the deck, in the same order as repeated pop()
+        self._num_remaining -= num_cards
+        dealt = self._cards[self._num_remaining:self._num_remaining + num_cards]
+        dealt.reverse()
+        return dealt
 
 class Match:
     def __init__(self):
         self.initialize_deck()
         self.players = [Player(1), Player(2)]
-        self._tricks = {player: [] for player in self.players}
-        self._hands  = {player: [] for player in self.players}
+        self._tricks = [[] for _ in self.players]
+        self._hands  = [[] for _ in self.players]
+        self._hand_masks = [0 for _ in self.players]
+        self._owned_masks = [0 for _ in self.players]
+        self._num_scopas = [0 for _ in self.players]
         self._tabletop = []
+        self._tabletop_mask = 0
+        self._capture_index = {}
         self._last_player_to_pickup = None
         self._turn_number = 0
 
@@ -91,17 +204,26 @@ class Match:
         self._deck = Deck()
 
     def deal_cards_to_table(self):
-        self._tabletop.extend(self._deck.deal_cards(4))
+        dealt = self._deck.deal_cards(4)
+        self._tabletop.extend(dealt)
+        for card in dealt:
+            self._tabletop_mask |= 1 << card
+        self._rebuild_capture_index()
 
     def deal_cards_to_players(self):
         for player in self.players:
-            self._hands[player] = self._deck.deal_cards(3)
+            hand = self._deck.deal_cards(3)
+            mask = 0
+            for card in hand:
+                mask |= 1 << card
+            self._hands[player.index] = hand
+            self._hand_masks[player.index] = mask
 
     def state(self, deck=True):
         d = {}
         d["TableTop"] = self._tabletop
         for player in self.players:
-            d[f"Player{player.number}"] = dict(hand=self._hands[player], tricks=self._tricks[player])
+            d[f"Player{player.number}"] = dict(hand=self._hands[player.index], tricks=self._tricks[player.index])
         if deck:
             d["Deck"] = list(self._deck)
         return d
@@ -110,6 +232,10 @@ class Match:
         from pprint import pformat
         return pformat(self.state(deck=False))
 
+    def display_state(self):
+        from pprint import pformat
+        print(pformat(self.state()))
+
     def tabletop(self):
         return self._tabletop
 
@@ -126,34 +252,67 @@ class Match:
              'Player2': {'hand': [7S, 9B, 8D], 'tricks': []},
              'TableTop': [8B, 1C, 1B, 9S]}
             sage: Player1, Player2 = M.players
-            sage: M.play_card(Player1, '4D', []); M
+            sage: M.play_card_str(Player1, '4D', []); M
             {'Player1': {'hand': [3D, 6S], 'tricks': []},
              'Player2': {'hand': [7S, 9B, 8D], 'tricks': []},
              'TableTop': [8B, 1C, 1B, 9S, 4D]}
-            sage: M.play_card(Player2, '9B', ['9S']); M
+            sage: M.play_card_str(Player2, '9B', ['9S']); M
             {'Player1': {'hand': [3D, 6S], 'tricks': []},
              'Player2': {'hand': [7S, 8D],
                          'tricks': [Trick(card_played=9B, cards_picked_up=(9S,), scopa=0)]},
              'TableTop': [8B, 1C, 1B, 4D]}
 
         """
-        card_to_play = Card(card_to_play)
-        cards_from_table = [Card(card) for card in cards_from_table]
+        if cards_from_table and not self.verify_play(player, card_to_play, cards_from_table):
+            raise ValueError
+        self._apply_play(player, card_to_play, cards_from_table)
 
+    def _apply_play(self, player, card_to_play, cards_from_table):
+        r"""
+        Apply an already-verified play. :meth:`random_play` calls this
+        directly, since the plays it draws from the capture index are
+        legal by construction.
+        """
         self._turn_number += 1
 
-        if cards_from_table == []:
-            self._hands[player].remove(card_to_play)
+        if not cards_from_table:
+            self._hands[player.index].remove(card_to_play)
+            self._hand_masks[player.index] &= ~(1 << card_to_play)
             self._tabletop.append(card_to_play)
-        elif self.verify_play(player, card_to_play, cards_from_table):
-            self._hands[player].remove(card_to_play)
+            self._tabletop_mask |= 1 << card_to_play
+            self._rebuild_capture_index()
+        else:
+            self._hands[player.index].remove(card_to_play)
+            self._hand_masks[player.index] &= ~(1 << card_to_play)
+            taken_mask = 0
             for card in cards_from_table:
-                self._tabletop.remove(card)
-            scopa_point = 0 if self._tabletop and self._turn_number != 36 else 1
-            self._tricks[player].append(Trick(card_to_play, tuple(cards_from_table), scopa_point))
+                taken_mask |= 1 << card
+            self._tabletop = [card for card in self._tabletop
+                              if not (taken_mask >> card) & 1]
+            self._tabletop_mask &= ~taken_mask
+            self._owned_masks[player.index] |= taken_mask | (1 << card_to_play)
+            self._rebuild_capture_index()
+            scopa_point = 0 if self._tabletop_mask and self._turn_number != 36 else 1
+            self._num_scopas[player.index] += scopa_point
+            self._tricks[player.index].append(Trick(card_to_play, tuple(cards_from_table), scopa_point))
             self._last_player_to_pickup = player
-        else:
-            raise ValueError
+
+    def play_card_str(self, player, card_to_play, cards_from_table):
+        r"""
+        Parse cards given as strings (``'4D'``) and delegate to
+        :meth:`play_card`, which expects card ids.
+
+        TESTS::
+
+            sage: M = TestMatch()
+            sage: M.deal_cards_to_table()
+            sage: M.deal_cards_to_players()
+            sage: Player1, Player2 = M.players
+            sage: M.play_card_str(Player1, '4D', []); M.tabletop()
+            [8B, 1C, 1B, 9S, 4D]
+
+        """
+        self.play_card(player, Card(card_to_play), [Card(card) for card in cards_from_table])
 
     def verify_play(self, player, card_to_play, cards_from_table):
         r"""
@@ -210,64 +369,109 @@ class Match:
         """
 
         # card to play is in player's hand
-        if card_to_play not in self._hands[player]:
+        if not (self._hand_masks[player.index] >> card_to_play) & 1:
             return False
 
-        # all cards in cards_from_table are on the table
-        if any(card not in self._tabletop for card in cards_from_table):
+        # single pass over cards_from_table: every card must be on the table,
+        # and their values must sum to the value of the card played
+        need_mask = 0
+        total = 0
+        for card in cards_from_table:
+            need_mask |= 1 << card
+            total += CARD_VALUES[card]
+        if need_mask & ~self._tabletop_mask:
             return False
-
-        # sum of cards from table equals value of card played
-        if cards_from_table and card_to_play.value != sum(card.value for card in cards_from_table):
+        if cards_from_table and CARD_VALUES[card_to_play] != total:
             return False
 
         # you can only pick up multiple cards from the table if there isn't an exact match
         if len(cards_from_table) > 1:
-            if card_to_play.value in [card.value for card in self._tabletop]:
+            if self._tabletop_mask & VALUE_MASKS[CARD_VALUES[card_to_play] - 1]:
                 return False
 
         return True
 
+    def _rebuild_capture_index(self):
+        r"""
+        Recompute ``self._capture_index``, mapping each value `v` to the
+        masks of the legal captures for a played card of value `v` on
+        the current tabletop.
+
+        Runs once per tabletop change, as a depth-first search over the
+        tabletop cards that prunes any partial sum above 10 (the largest
+        value a played card can have), so most of the powerset is never
+        visited. The exact-match rule is applied here, so a value with a
+        matching card on the table maps to its single-card captures
+        only.
+        """
+        cards = []
+        m = self._tabletop_mask
+        while m:
+            cards.append((m & -m).bit_length() - 1)
+            m &= m - 1
+
+        index = {}
+        def extend(start, mask, total):
+            for i in range(start, len(cards)):
+                card = cards[i]
+                new_total = total + CARD_VALUES[card]
+                if new_total <= 10:
+                    new_mask = mask | (1 << card)
+                    index.setdefault(new_total, []).append(new_mask)
+                    extend(i + 1, new_mask, new_total)
+        extend(0, 0, 0)
+
+        for value, take_masks in index.items():
+            if self._tabletop_mask & VALUE_MASKS[value - 1]:
+                index[value] = [mask for mask in take_masks if not mask & (mask - 1)]
+        self._capture_index = index
+
+    def sweep_tabletop(self):
+        r"""
+        Give the cards left on the table at the end of a match to the
+        last player who picked up, as a final trick with no card played
+        and no scopa. Return that player, or ``None`` if the table is
+        already empty.
+        """
+        if not self._tabletop:
+            return None
+        player = self._last_player_to_pickup
+        self._tricks[player.index].append(Trick(None, tuple(self._tabletop), 0))
+        self._owned_masks[player.index] |= self._tabletop_mask
+        self._tabletop = []
+        self._tabletop_mask = 0
+        self._rebuild_capture_index()
+        return player
+
     def play_turn(self, player):
         while True:
             card_to_play = input('card to play: ')
             card_to_play = self._deck.card_from_str(card_to_play)
             print(f"{card_to_play = }")
 
-            cards_from_table = input('cards from table: ').replace(',', ' ').split(' ')
-            cards_from_table = [self._deck.card_from_str(card) for card in cards_from_table]
+            tokens = CARD_SEP.split(input('cards from table: ').strip())
+            cards_from_table = [self._deck.card_from_str(token) for token in tokens if token]
             print(f"{cards_from_table = }")
 
     def tally_tricks(self):
-        SETTEBELLO = Card(SETTEBELLO_VALUE, SETTEBELLO_SUIT)
-
         tally = {}
         for player in self.players:
-            num_scopas = 0
-            num_cards = 0
-            num_denari = 0
-            settebello = 0
-            primiera_cards = [Card(0, 0), Card(0, 1), Card(0, 2), Card(0, 3)]
-            primiera_score = [0, 0, 0, 0]
-
-            for trick in self._tricks[player]:
-                num_scopas += trick.scopa
-                for card in trick.cards_picked_up + (trick.card_played,):
-                    if card:
-                        num_cards += 1
-                        if card.suit == SETTEBELLO_SUIT:
-                            num_denari += 1
-                        if card == SETTEBELLO:
-                            settebello = 1
-                        if PRIMIERA_POINTS[card.value] > primiera_score[card.suit]:
-                            primiera_cards[card.suit] = card
-                            primiera_score[card.suit] = PRIMIERA_POINTS[card.value]
-
-            tally[player] = (num_scopas,
-                             num_cards,
-                             num_denari,
-                             settebello,
-                             sum(primiera_score),
+            owned = self._owned_masks[player.index]
+
+            primiera_cards = [None, None, None, None]
+            primiera_score = 0
+            for suit in range(4):
+                for card in PRIMIERA_ORDER[suit]:
+                    if (owned >> card) & 1:
+                        primiera_cards[suit] = CARDS[card]
+                        primiera_score += PRIMIERA_POINTS[CARD_VALUES[card]]
+                        break
+
+            tally[player] = (self._num_scopas[player.index],
+                             owned.bit_count(),
+                             (owned & DENARI_MASK).bit_count(),
+                             (owned >> SETTEBELLO_ID) & 1,
+                             primiera_score,
                              primiera_cards)
 
         return tally
@@ -307,6 +511,23 @@ class Match:
             sage: M = TestMatch()
             sage: M.play_random_match()
 
+        """
+        rows = self._play_out(self.random_play, verbose=verbose)
+
+        if verbose:
+            print(table(rows))
+            print()
+
+            print(f"tally: {self.tally_tricks()}")
+
+            print(f"score: {self.score_match()}")
+
+    def _play_out(self, choose_play, verbose=True):
+        r"""
+        Play the match to completion, choosing and applying each play
+        with ``choose_play(player)``, and return the rows describing
+        the plays for display. With ``verbose=False`` no rows are
+        built, so a rollout pays nothing for formatting.
         """
         self.deal_cards_to_table()
 
@@ -315,36 +536,59 @@ class Match:
             self.deal_cards_to_players()
             for _ in range(3):
                 for player in self.players:
+                    if not verbose:
+                        choose_play(player)
+                        continue
                     row = [f"{self._tabletop}"]
-                    card_to_play, cards_from_table = self.random_play(player)
+                    card_to_play, cards_from_table = choose_play(player)
                     if cards_from_table:
                         row.append(f"{player} plays {card_to_play} to pick up {str(cards_from_table)[1:-1]}")
                     else:
                         row.append(f"{player} places {card_to_play} on table")
                     rows.append(row)
 
-        row = [f"{self._tabletop}"]
-        if self._tabletop:
-            last_trick = Trick(None, tuple(self._tabletop), 0)
-            self._tricks[self._last_player_to_pickup].append(last_trick)
-            self._tabletop = []
-            row.append(f"Cards on TableTop go to {self._last_player_to_pickup}")
-        rows.append(row)
-
-        print(table(rows))
-        print()
-
-        print(f"tally: {self.tally_tricks()}")
-
-        print(f"score: {self.score_match()}")
+        if verbose:
+            row = [f"{self._tabletop}"]
+        swept_to = self.sweep_tabletop()
+        if verbose:
+            if swept_to is not None:
+                row.append(f"Cards on TableTop go to {swept_to}")
+            rows.append(row)
 
+        return rows
 
     def random_play(self, player):
         import random
-        card_to_play, cards_from_table = random.choice(self.possible_plays(player))
-        self.play_card(player, card_to_play, cards_from_table)
+        # reservoir sampling: uniform over the plays without materializing them
+        chosen = None
+        count = 0
+        for play in self._iter_possible_plays(player):
+            count += 1
+            if random.random() * count < 1:
+                chosen = play
+        card_to_play, cards_from_table = chosen
+        self._apply_play(player, card_to_play, cards_from_table)
         return card_to_play, cards_from_table
 
+    def _iter_possible_plays(self, player):
+        r"""
+        Yield the plays of :meth:`possible_plays` one at a time: the
+        capture plays in hand order, then a no-pickup play for each
+        hand card that had no capture (tracked with a bit per hand
+        card).
+        """
+        players_hand = self._hands[player.index]
+        no_capture = 0
+        for i, card_to_play in enumerate(players_hand):
+            take_masks = self._capture_index.get(CARD_VALUES[card_to_play], ())
+            for take_mask in take_masks:
+                yield (card_to_play, cards_from_mask(take_mask))
+            if not take_masks:
+                no_capture |= 1 << i
+        for i, card_to_play in enumerate(players_hand):
+            if (no_capture >> i) & 1:
+                yield (card_to_play, ())
+
     def possible_plays(self, player):
         r"""
 
@@ -361,22 +605,15 @@ class Match:
             sage: M.possible_plays(Player1)
             [(3D, ()), (6S, ()), (4D, ())]
             sage: M.possible_plays(Player2)
-            [(8D, (8B,)), (9B, (9S,)), (7S, ())]
+            [(9B, (9S,)), (8D, (8B,)), (7S, ())]
 
         """
-        players_hand = self._hands[player]
-        plays = []
-        for cards_from_table in powerset(self._tabletop):
-            s = sum(card.value for card in cards_from_table)
-            for card_to_play in players_hand:
-                if card_to_play.value == s:
-                    if self.verify_play(player, card_to_play, cards_from_table):
-                        plays.append((card_to_play, cards_from_table))
-        for card_to_play in players_hand:
-            if card_to_play not in [play[0] for play in plays]:
-                plays.append((card_to_play, ()))
-        return plays
+        return list(self._iter_possible_plays(player))
+
 
+# the fixed deal used by TestMatch, built once at import time
+_TEST_DECK = tuple(Card(value, suit) for (value, suit) in
+                   [(4,1),(5,2),(5,1),(8,1),(4,3),(1,2),(3,0),(6,1),(9,1),(7,2),(7,1),(6,2),(10,1),(10,3),(9,2),(2,1),(2,2),(10,2),(10,0),(1,0),(3,1),(4,0),(5,0),(2,0),(2,3),(7,3),(8,0),(5,3),(6,3),(3,3),(8,2),(9,3),(7,0),(4,2),(6,0),(3,2),(9,0),(1,3),(1,1),(8,3)])
 
 class TestMatch(Match):
     r"""
@@ -404,36 +641,36 @@ class TestMatch(Match):
 
     Round begins. Players alternate playing a card, starting with player 0::
 
-        sage: M.play_card(Player1, '4D', []); M
+        sage: M.play_card_str(Player1, '4D', []); M
         {'Player1': {'hand': [3D, 6S], 'tricks': []},
          'Player2': {'hand': [7S, 9B, 8D], 'tricks': []},
          'TableTop': [8B, 1C, 1B, 9S, 4D]}
-        sage: M.play_card(Player2, '9B', ['9S']); M
+        sage: M.play_card_str(Player2, '9B', ['9S']); M
         {'Player1': {'hand': [3D, 6S], 'tricks': []},
          'Player2': {'hand': [7S, 8D],
                      'tricks': [Trick(card_played=9B, cards_picked_up=(9S,), scopa=0)]},
          'TableTop': [8B, 1C, 1B, 4D]}
-        sage: M.play_card(Player1, '6S', ['1C', '1B', '4D']); M
+        sage: M.play_card_str(Player1, '6S', ['1C', '1B', '4D']); M
         {'Player1': {'hand': [3D],
                      'tricks': [Trick(card_played=6S, cards_picked_up=(1C, 1B, 4D), scopa=0)]},
          'Player2': {'hand': [7S, 8D],
                      'tricks': [Trick(card_played=9B, cards_picked_up=(9S,), scopa=0)]},
          'TableTop': [8B]}
-        sage: M.play_card(Player2, '8D', ['8B']); M
+        sage: M.play_card_str(Player2, '8D', ['8B']); M
         {'Player1': {'hand': [3D],
                      'tricks': [Trick(card_played=6S, cards_picked_up=(1C, 1B, 4D), scopa=0)]},
          'Player2': {'hand': [7S],
                      'tricks': [Trick(card_played=9B, cards_picked_up=(9S,), scopa=0),
                                 Trick(card_played=8D, cards_picked_up=(8B,), scopa=1)]},
          'TableTop': []}
-        sage: M.play_card(Player1, '3D', []); M
+        sage: M.play_card_str(Player1, '3D', []); M
         {'Player1': {'hand': [],
                      'tricks': [Trick(card_played=6S, cards_picked_up=(1C, 1B, 4D), scopa=0)]},
          'Player2': {'hand': [7S],
                      'tricks': [Trick(card_played=9B, cards_picked_up=(9S,), scopa=0),
                                 Trick(card_played=8D, cards_picked_up=(8B,), scopa=1)]},
          'TableTop': [3D]}
-        sage: M.play_card(Player2, '7S', []); M
+        sage: M.play_card_str(Player2, '7S', []); M
         {'Player1': {'hand': [],
                      'tricks': [Trick(card_played=6S, cards_picked_up=(1C, 1B, 4D), scopa=0)]},
          'Player2': {'hand': [],
@@ -458,9 +695,9 @@ class TestMatch(Match):
 
     """
     def initialize_deck(self):
-        test_deck = [(4,1),(5,2),(5,1),(8,1),(4,3),(1,2),(3,0),(6,1),(9,1),(7,2),(7,1),(6,2),(10,1),(10,3),(9,2),(2,1),(2,2),(10,2),(10,0),(1,0),(3,1),(4,0),(5,0),(2,0),(2,3),(7,3),(8,0),(5,3),(6,3),(3,3),(8,2),(9,3),(7,0),(4,2),(6,0),(3,2),(9,0),(1,3),(1,1),(8,3)]
-        deck = Deck()
-        deck._cards = [Card(value, suit) for (value, suit) in test_deck]
+        deck = Deck.__new__(Deck)
+        deck._cards = list(_TEST_DECK)
+        deck._num_remaining = len(deck._cards)
         self._deck = deck
 
     def play_test_match(self, verbose=True):
@@ -471,29 +708,12 @@ class TestMatch(Match):
             sage: TestMatch().play_test_match()
 
         """
-        self.deal_cards_to_table()
-
-        rows = []
-        while self._deck:
-            self.deal_cards_to_players()
-            for _ in range(3):
-                for player in self.players:
-                    row = [f"{self._tabletop}"]
-                    card_to_play, cards_from_table = self.possible_plays(player)[0]
-                    self.play_card(player, card_to_play, cards_from_table)
-                    if cards_from_table:
-                        row.append(f"{player} plays {card_to_play} to pick up {str(cards_from_table)[1:-1]}")
-                    else:
-                        row.append(f"{player} places {card_to_play} on table")
-                    rows.append(row)
+        def first_play(player):
+            card_to_play, cards_from_table = self.possible_plays(player)[0]
+            self.play_card(player, card_to_play, cards_from_table)
+            return card_to_play, cards_from_table
 
-        row = [f"{self._tabletop}"]
-        if self._tabletop:
-            last_trick = Trick(None, tuple(self._tabletop), 0)
-            self._tricks[self._last_player_to_pickup].append(last_trick)
-            self._tabletop = []
-            row.append(f"Cards on TableTop go to {self._last_player_to_pickup}")
-        rows.append(row)
+        rows = self._play_out(first_play)
 
         print(table(rows))
         print()
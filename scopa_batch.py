@@ -0,0 +1,258 @@
+r"""
+Vectorized Monte-Carlo simulation of many independent matches.
+
+All matches in a batch advance in lockstep: the state of match `b` is a
+packed 40-bit integer mask (`tabletop_masks[b]`, `hand_masks[b, p]`,
+`owned_masks[b, p]`) over the card ids of :mod:`scopa`, held on a
+:class:`BatchMatch` and advanced with NumPy bitwise ufuncs instead of
+one Python-level ``play_card`` call per match. Importing this module
+requires ``numpy``; :mod:`scopa` itself does not depend on it.
+
+The per-turn bookkeeping (legality, capture sums, scopa points,
+owned-card tracking, scoring) is fully vectorized; only the final move
+*choice* runs per match, so the batch size should be in the thousands
+before this beats a plain loop over ``Match.play_random_match``.
+"""
+import numpy as np
+
+from scopa import (CARD_VALUES, DENARI_MASK, PRIMIERA_POINTS,
+                   SETTEBELLO_ID, VALUE_MASKS)
+
+_ONE = np.uint64(1)
+_ZERO = np.uint64(0)
+_CARD_VALUES = np.array(CARD_VALUES, dtype=np.int64)
+
+# tables larger than this fall back to the Python enumerator
+TABLE_LIMIT = 10
+# SUBSET_MATRIX[s, i] is 1 when table slot i belongs to subset s, so the
+# value sums of all 1024 subsets of a table are one matrix product
+SUBSET_MATRIX = np.array([[(s >> i) & 1 for i in range(TABLE_LIMIT)]
+                          for s in range(1 << TABLE_LIMIT)], dtype=np.int64)
+
+def _popcount(masks):
+    r"""
+    Return the number of set bits in each entry of ``masks`` (uint64).
+    """
+    masks = np.ascontiguousarray(masks)
+    bits = np.unpackbits(masks.view(np.uint8).reshape(masks.size, masks.itemsize), axis=1)
+    return bits.sum(axis=1).astype(np.int64).reshape(masks.shape)
+
+def _mask_values_sum(take_masks):
+    r"""
+    Return the sum of card values over the set bits of each mask.
+    """
+    totals = np.zeros(take_masks.shape, dtype=np.int64)
+    for value in range(1, 11):
+        totals += value * _popcount(take_masks & np.uint64(VALUE_MASKS[value - 1]))
+    return totals
+
+def verify_plays(tabletop_masks, hand_masks, played, take_masks):
+    r"""
+    Vectorized ``Match.verify_play``: return a boolean array marking the
+    matches whose proposed move is legal.
+
+    TESTS:
+
+    Agrees with the scalar rule on the ``Match.verify_play`` doctest
+    cases, run against the fixed test deal::
+
+        sage: from scopa import TestMatch, Card
+        sage: M = TestMatch()
+        sage: M.deal_cards_to_table()
+        sage: M.deal_cards_to_players()
+        sage: Player1, Player2 = M.players
+        sage: cases = [(Player1, Card(6, 1), []), (Player1, Card(6, 0), []),
+        ....:          (Player2, Card(9, 0), [Card(9, 0)]), (Player2, Card(9, 3), [Card(9, 0)]),
+        ....:          (Player2, Card(8, 2), [Card(8, 1)]), (Player2, Card(8, 2), [Card(8, 3)])]
+        sage: tabletops = np.full(len(cases), M._tabletop_mask, dtype=np.uint64)
+        sage: hands = np.array([M._hand_masks[p.index] for (p, c, t) in cases], dtype=np.uint64)
+        sage: played = np.array([int(c) for (p, c, t) in cases])
+        sage: takes = np.array([sum(1 << c for c in t) for (p, c, t) in cases], dtype=np.uint64)
+        sage: verify_plays(tabletops, hands, played, takes).tolist()
+        [False, True, False, True, False, True]
+        sage: [M.verify_play(p, c, t) for (p, c, t) in cases]
+        [False, True, False, True, False, True]
+
+    """
+    played = played.astype(np.uint64)
+    in_hand = (hand_masks >> played) & _ONE != 0
+    on_table = take_masks & ~tabletop_masks == 0
+
+    played_values = _CARD_VALUES[played]
+    sum_ok = _mask_values_sum(take_masks) == played_values
+
+    num_taken = _popcount(take_masks)
+    exact_masks = np.array(VALUE_MASKS, dtype=np.uint64)[played_values - 1]
+    no_better_exact = (num_taken <= 1) | (tabletop_masks & exact_masks == 0)
+
+    is_capture = take_masks != 0
+    return in_hand & (~is_capture | (on_table & sum_ok & no_better_exact))
+
+def _subsets_summing_to(cards, target):
+    r"""
+    Yield the masks of the subsets of ``cards`` (a list of card ids)
+    whose values sum to ``target``, pruning partial sums above it.
+    Fallback enumerator for tables larger than ``TABLE_LIMIT``.
+    """
+    def extend(index, mask, total):
+        if total == target:
+            yield mask
+            return
+        for i in range(index, len(cards)):
+            card = cards[i]
+            if total + CARD_VALUES[card] <= target:
+                yield from extend(i + 1, mask | (1 << card), total + CARD_VALUES[card])
+    yield from extend(0, 0, 0)
+
+class BatchMatch:
+    r"""
+    The state of ``num_matches`` independent matches, as packed-mask
+    arrays advanced in lockstep. ``simulate_batch`` drives one of these
+    to completion; the individual arrays are public so custom policies
+    can read them.
+    """
+    def __init__(self, num_matches, rng=None):
+        if rng is None:
+            rng = np.random.default_rng()
+        self.num_matches = num_matches
+        self.rng = rng
+        # one shuffled deck per match; cards are dealt from the end, as Deck does
+        self.decks = np.argsort(rng.random((num_matches, 40)), axis=1).astype(np.uint64)
+        self.deck_ptr = 36
+        self.tabletop_masks = np.bitwise_or.reduce(_ONE << self.decks[:, 36:40], axis=1)
+        self.hand_masks = np.zeros((num_matches, 2), dtype=np.uint64)
+        self.owned_masks = np.zeros((num_matches, 2), dtype=np.uint64)
+        self.num_scopas = np.zeros((num_matches, 2), dtype=np.int64)
+        self.last_to_pickup = np.zeros(num_matches, dtype=np.int64)
+        self.turn_number = 0
+
+    def deal_hands(self):
+        for p in (0, 1):
+            self.deck_ptr -= 3
+            dealt = self.decks[:, self.deck_ptr:self.deck_ptr + 3]
+            self.hand_masks[:, p] = np.bitwise_or.reduce(_ONE << dealt, axis=1)
+
+    def table_layout(self):
+        r"""
+        Return ``(slots, counts)``: per match, the ids of the cards on
+        the table packed into the first ``counts[b]`` entries of row
+        ``slots[b]`` (shape ``(num_matches, TABLE_LIMIT)``).
+        """
+        present = ((self.tabletop_masks[:, None] >> np.arange(40, dtype=np.uint64)) & _ONE).astype(bool)
+        counts = present.sum(axis=1)
+        slots = np.argsort(~present, axis=1, kind='stable')[:, :TABLE_LIMIT]
+        return slots, counts
+
+    def capture_sums(self):
+        r"""
+        Return ``(slots, counts, sums)`` where ``sums[b, s]`` is the
+        total value of subset ``s`` (a bitmask over the slots of match
+        ``b``); subsets touching slots past ``counts[b]`` contribute
+        padding zeros and must be ignored by masking ``s < 1 << counts[b]``.
+        """
+        slots, counts = self.table_layout()
+        values = np.where(np.arange(TABLE_LIMIT) < counts[:, None], _CARD_VALUES[slots], 0)
+        return slots, counts, values @ SUBSET_MATRIX.T
+
+    def apply_moves(self, p, played, take_masks):
+        r"""
+        Apply player ``p``'s chosen moves to every match at once.
+        """
+        self.turn_number += 1
+        played = played.astype(np.uint64)
+        self.hand_masks[:, p] &= ~(_ONE << played)
+
+        is_capture = take_masks != 0
+        self.tabletop_masks = np.where(is_capture,
+                                       self.tabletop_masks & ~take_masks,
+                                       self.tabletop_masks | (_ONE << played))
+        self.owned_masks[:, p] |= np.where(is_capture, take_masks | (_ONE << played), _ZERO)
+        scopa = is_capture & ((self.tabletop_masks == 0) | (self.turn_number == 36))
+        self.num_scopas[:, p] += scopa
+        self.last_to_pickup = np.where(is_capture, p, self.last_to_pickup)
+
+    def sweep_tabletop(self):
+        for p in (0, 1):
+            self.owned_masks[:, p] |= np.where(self.last_to_pickup == p, self.tabletop_masks, _ZERO)
+        self.tabletop_masks[:] = 0
+
+def random_policy(batch, p):
+    r"""
+    Choose a uniformly random legal play per match, mirroring
+    ``Match.possible_plays``: all legal captures, plus a placement for
+    each hand card that has no capture. Returns ``(played, take_masks)``.
+
+    The capture sums for all matches come from one ``capture_sums``
+    matmul; only the uniform choice itself runs per match.
+    """
+    slots, counts, sums = batch.capture_sums()
+    rng = batch.rng
+    played = np.zeros(batch.num_matches, dtype=np.uint64)
+    take_masks = np.zeros(batch.num_matches, dtype=np.uint64)
+    for b in range(batch.num_matches):
+        tabletop = int(batch.tabletop_masks[b])
+        count = int(counts[b])
+        hand = int(batch.hand_masks[b, p])
+        plays = []
+        for card in (c for c in range(40) if (hand >> c) & 1):
+            value = CARD_VALUES[card]
+            matching = tabletop & VALUE_MASKS[value - 1]
+            if matching:
+                # enumerate from the full mask: slots is truncated to
+                # TABLE_LIMIT columns, so it can miss cards past the 10th
+                captures = []
+                while matching:
+                    captures.append(matching & -matching)
+                    matching &= matching - 1
+            elif count <= TABLE_LIMIT:
+                subsets = np.nonzero(sums[b, 1:1 << count] == value)[0] + 1
+                captures = [sum(1 << int(slots[b, i]) for i in range(count) if (s >> i) & 1)
+                            for s in subsets]
+            else:
+                table_cards = [c for c in range(40) if (tabletop >> c) & 1]
+                captures = [m for m in _subsets_summing_to(table_cards, value) if m]
+            plays.extend((card, m) for m in captures)
+            if not captures:
+                plays.append((card, 0))
+        played[b], take_masks[b] = plays[rng.integers(len(plays))]
+    return played, take_masks
+
+def simulate_batch(num_matches, policy_fn=random_policy, rng=None):
+    r"""
+    Play ``num_matches`` independent random-deal matches to completion
+    and return the final points as an array of shape ``(num_matches, 2)``.
+
+    ``policy_fn(batch, p)`` is called once per half-turn with the
+    :class:`BatchMatch` and the player to move, and must return
+    per-match ``(played, take_masks)`` arrays.
+    """
+    batch = BatchMatch(num_matches, rng)
+    for _ in range(6):
+        batch.deal_hands()
+        for _ in range(3):
+            for p in (0, 1):
+                played, take_masks = policy_fn(batch, p)
+                batch.apply_moves(p, played, take_masks)
+    batch.sweep_tabletop()
+    return score_batch(batch.owned_masks, batch.num_scopas)
+
+def score_batch(owned_masks, num_scopas):
+    r"""
+    Vectorized ``Match.score_match`` over per-player owned-card masks.
+    """
+    num_cards = _popcount(owned_masks)
+    num_denari = _popcount(owned_masks & np.uint64(DENARI_MASK))
+    settebello = ((owned_masks >> np.uint64(SETTEBELLO_ID)) & _ONE).astype(np.int64)
+
+    primiera = np.zeros(owned_masks.shape, dtype=np.int64)
+    for suit in range(4):
+        best = np.zeros(owned_masks.shape, dtype=np.int64)
+        for value in range(1, 11):
+            card_bit = (owned_masks >> np.uint64((value - 1) * 4 + suit)) & _ONE
+            best = np.maximum(best, PRIMIERA_POINTS[value] * card_bit.astype(np.int64))
+        primiera += best
+
+    points = num_scopas + (num_cards > 20) + (num_denari > 5) + settebello
+    points[:, 0] += primiera[:, 0] > primiera[:, 1]
+    points[:, 1] += primiera[:, 1] > primiera[:, 0]
+    return points
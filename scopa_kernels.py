@@ -0,0 +1,177 @@
+r"""
+Numba-compiled kernels for simulation-driven play.
+
+Cards are the integer ids of :mod:`scopa` (``(value - 1) * 4 + suit``)
+and hands/tabletop are 40-bit masks over those ids, so move legality and
+application are pure integer arithmetic. Importing this module requires
+``numba``; :mod:`scopa` itself does not depend on it, so interactive use
+keeps working without the compiler installed. Monte-Carlo drivers that
+call the move path millions of times should use these kernels instead of
+``Match.play_card``.
+"""
+import numpy as np
+from numba import njit
+
+@njit(cache=True)
+def card_value_jit(card):
+    return (card >> 2) + 1
+
+@njit(cache=True)
+def verify_play_jit(tabletop_mask, hand_mask, played, take_mask):
+    r"""
+    Return ``True`` if playing card id ``played`` from the hand
+    ``hand_mask`` to pick up the cards in ``take_mask`` is legal on
+    ``tabletop_mask``.
+
+    Mirrors ``Match.verify_play``: the played card must be in hand, the
+    picked-up cards must be on the table, their values must sum to the
+    played value, and a multi-card pickup is forbidden when a card of
+    the played value is on the table.
+    """
+    if not (hand_mask >> played) & 1:
+        return False
+
+    if take_mask & ~tabletop_mask:
+        return False
+
+    if take_mask == 0:
+        return True
+
+    total = 0
+    num_taken = 0
+    m = take_mask
+    while m:
+        card = 0
+        low = m & -m
+        while low > 1:
+            low >>= 1
+            card += 1
+        total += (card >> 2) + 1
+        num_taken += 1
+        m &= m - 1
+
+    played_value = (played >> 2) + 1
+    if total != played_value:
+        return False
+
+    if num_taken > 1:
+        if tabletop_mask & (0xF << ((played_value - 1) * 4)):
+            return False
+
+    return True
+
+@njit(cache=True)
+def apply_move_jit(tabletop_mask, hand_mask, played, take_mask, turn_number):
+    r"""
+    Apply a move and return ``(tabletop_mask, hand_mask, scopa_point,
+    valid)``.
+
+    ``take_mask == 0`` places the played card on the table; otherwise
+    the move is verified and the pickup applied. ``turn_number`` is the
+    1-based turn just played (a sweep on turn 36 follows the same rule
+    as ``Match.play_card``). On an illegal move the input masks are
+    returned unchanged with ``valid`` false.
+    """
+    if take_mask == 0:
+        if not (hand_mask >> played) & 1:
+            return tabletop_mask, hand_mask, 0, False
+        return tabletop_mask | (1 << played), hand_mask & ~(1 << played), 0, True
+
+    if not verify_play_jit(tabletop_mask, hand_mask, played, take_mask):
+        return tabletop_mask, hand_mask, 0, False
+
+    tabletop_mask &= ~take_mask
+    hand_mask &= ~(1 << played)
+    scopa_point = 0 if tabletop_mask and turn_number != 36 else 1
+    return tabletop_mask, hand_mask, scopa_point, True
+
+@njit(cache=True)
+def possible_plays_jit(tabletop_mask, hand_ids):
+    r"""
+    Return the legal plays for a hand as two parallel arrays
+    ``(card_ids, take_masks)``, in the order of
+    ``Match.possible_plays``: the captures for each hand card, then a
+    placement (``take_mask == 0``) for each hand card with no capture.
+    """
+    table = np.empty(40, dtype=np.int64)
+    n = 0
+    m = tabletop_mask
+    while m:
+        card = 0
+        low = m & -m
+        while low > 1:
+            low >>= 1
+            card += 1
+        table[n] = card
+        n += 1
+        m &= m - 1
+
+    # sums[s] = sums[s with its lowest bit cleared] + that card's value,
+    # one addition per subset instead of n
+    num_subsets = 1 << n
+    sums = np.zeros(num_subsets, dtype=np.int64)
+    for s in range(1, num_subsets):
+        low = 0
+        bit = s & -s
+        while bit > 1:
+            bit >>= 1
+            low += 1
+        sums[s] = sums[s & (s - 1)] + (table[low] >> 2) + 1
+
+    num_plays = 0
+    for h in range(hand_ids.shape[0]):
+        value = (hand_ids[h] >> 2) + 1
+        found = 0
+        if (tabletop_mask >> ((value - 1) * 4)) & 0xF:
+            # exact match on the table: single-card captures only
+            for i in range(n):
+                if (table[i] >> 2) + 1 == value:
+                    found += 1
+        else:
+            for s in range(1, num_subsets):
+                if sums[s] == value:
+                    found += 1
+        num_plays += found if found else 1
+
+    card_ids = np.empty(num_plays, dtype=np.int64)
+    take_masks = np.empty(num_plays, dtype=np.int64)
+    k = 0
+    no_capture = 0
+    for h in range(hand_ids.shape[0]):
+        value = (hand_ids[h] >> 2) + 1
+        found = False
+        if (tabletop_mask >> ((value - 1) * 4)) & 0xF:
+            for i in range(n):
+                if (table[i] >> 2) + 1 == value:
+                    card_ids[k] = hand_ids[h]
+                    take_masks[k] = 1 << table[i]
+                    k += 1
+                    found = True
+        else:
+            for s in range(1, num_subsets):
+                if sums[s] == value:
+                    take_mask = 0
+                    for i in range(n):
+                        if (s >> i) & 1:
+                            take_mask |= 1 << table[i]
+                    card_ids[k] = hand_ids[h]
+                    take_masks[k] = take_mask
+                    k += 1
+                    found = True
+        if not found:
+            no_capture |= 1 << h
+    for h in range(hand_ids.shape[0]):
+        if (no_capture >> h) & 1:
+            card_ids[k] = hand_ids[h]
+            take_masks[k] = 0
+            k += 1
+    return card_ids, take_masks
+
+@njit(cache=True)
+def random_play_jit(tabletop_mask, hand_ids):
+    r"""
+    Return a uniformly random legal play ``(card_id, take_mask)``.
+    """
+    card_ids, take_masks = possible_plays_jit(tabletop_mask, hand_ids)
+    i = np.random.randint(card_ids.shape[0])
+    return card_ids[i], take_masks[i]